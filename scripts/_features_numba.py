@@ -0,0 +1,103 @@
+"""Fused EDA feature kernel (optional Numba acceleration).
+
+Computes, in a single sweep over log prices, the features used by
+eda_generate_figures.py: log drawdown and two realized-volatility windows.
+Semantics match the NumPy path in that script:
+- returns are log price ratios (precise for float32 close); ret[0] and
+  non-finite returns are missing; sums are accumulated in float64;
+- cumulative return skips missing returns (nancumsum);
+- realized volatility is the sample std (ddof=1) over ``window`` returns,
+  scaled by sqrt(window), and NaN unless all returns in the window are finite.
+
+If Numba is not installed, ``fused_features`` is None and callers use NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _fused_features(
+    close: np.ndarray, w1: int, w2: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute drawdown and realized volatility for two windows in one pass.
+
+    Parameters
+    ----------
+    close : np.ndarray
+        Close prices (float32 or float64).
+    w1 : int
+        First realized-volatility window.
+    w2 : int
+        Second realized-volatility window.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        ``(drawdown, rv_w1, rv_w2)`` aligned with ``close``.
+
+    Notes
+    -----
+    Rolling sums of r and r**2 are updated incrementally (add the new return,
+    drop the one leaving the window). Not compiled with fastmath, because the
+    missing-value checks rely on IEEE NaN semantics. The scan is inherently
+    sequential (running max), so ``parallel`` is not used.
+    """
+    n = close.size
+    ret = np.full(n, np.nan)
+    dd = np.zeros(n)
+    rv1 = np.full(n, np.nan)
+    rv2 = np.full(n, np.nan)
+
+    cum = 0.0
+    mx = 0.0
+    s1a = 0.0
+    s2a = 0.0
+    ca = 0
+    s1b = 0.0
+    s2b = 0.0
+    cb = 0
+    for i in range(1, n):
+        r = np.float64(np.log(close[i] / close[i - 1]))
+        if np.isfinite(r):
+            ret[i] = r
+            cum += r
+            s1a += r
+            s2a += r * r
+            ca += 1
+            s1b += r
+            s2b += r * r
+            cb += 1
+        if cum > mx:
+            mx = cum
+        dd[i] = cum - mx
+
+        j = i - w1
+        if j >= 1 and np.isfinite(ret[j]):
+            s1a -= ret[j]
+            s2a -= ret[j] * ret[j]
+            ca -= 1
+        if w1 >= 2 and i >= w1 and ca == w1:
+            rv1[i] = np.sqrt(max((s2a - s1a * s1a / w1) / (w1 - 1), 0.0) * w1)
+
+        j = i - w2
+        if j >= 1 and np.isfinite(ret[j]):
+            s1b -= ret[j]
+            s2b -= ret[j] * ret[j]
+            cb -= 1
+        if w2 >= 2 and i >= w2 and cb == w2:
+            rv2[i] = np.sqrt(max((s2b - s1b * s1b / w2) / (w2 - 1), 0.0) * w2)
+
+    return dd, rv1, rv2
+
+
+# error_model="numpy": a zero close yields inf/NaN (a missing return), as in NumPy,
+# instead of raising ZeroDivisionError.
+fused_features = (
+    njit(cache=True, error_model="numpy")(_fused_features) if njit is not None else None
+)
@@ -21,15 +21,22 @@ Phase 2 will add direct queue observability (L, λ, W) from OMS/infra logs.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import bisect
 import datetime as dt
 import json
-import time
+import ssl
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
-import ccxt
+import aiohttp
+import ccxt.async_support as ccxt
+import certifi
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from hash_utils import save_json, write_checksums_sha256
 from tqdm import tqdm
 
@@ -54,22 +61,6 @@ def utc_ms(ts: dt.datetime) -> int:
     return int(ts.timestamp() * 1000)
 
 
-def iso_utc_from_ms(ms: int) -> str:
-    """Convert Unix epoch milliseconds to an ISO-8601 UTC timestamp string.
-
-    Parameters
-    ----------
-    ms : int
-        Unix epoch timestamp in milliseconds.
-
-    Returns
-    -------
-    str
-        ISO-8601 formatted UTC timestamp.
-    """
-    return dt.datetime.fromtimestamp(ms / 1000, tz=dt.UTC).isoformat()
-
-
 def load_manifest(run_dir: Path) -> dict[str, Any]:
     """Load the run manifest from the specified directory.
 
@@ -92,8 +83,66 @@ def update_manifest(run_dir: Path, manifest: dict[str, Any]) -> None:
     save_json(manifest, run_dir / "manifest.json")
 
 
-def get_exchange(name: str) -> Any:
-    """Initialize a CCXT exchange instance with rate limiting enabled.
+def write_parquet(df: pd.DataFrame, path: Path, row_group_size: int = 50_000) -> None:
+    """Write a data artifact as zstd-compressed parquet.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame to persist (index is not stored).
+    path : Path
+        Output parquet path.
+    row_group_size : int, default=50_000
+        Rows per parquet row group.
+
+    Notes
+    -----
+    Dictionary encoding is restricted to low-cardinality columns (trade ``side``);
+    monotonic numeric columns compress well under zstd without it.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=[c for c in ("side",) if c in table.column_names],
+        row_group_size=row_group_size,
+    )
+
+
+def open_http_session(pool_size: int) -> aiohttp.ClientSession:
+    """Create the keep-alive HTTP session shared by all exchange requests.
+
+    Parameters
+    ----------
+    pool_size : int
+        Maximum number of pooled connections.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+        Session to pass to :func:`get_exchange` (the caller closes it).
+
+    Notes
+    -----
+    Connections and DNS lookups are reused across the pagination requests;
+    proxy settings are taken from the environment.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        ttl_dns_cache=300,
+        ssl=ssl.create_default_context(cafile=certifi.where()),
+    )
+    return aiohttp.ClientSession(connector=connector, trust_env=True)
+
+
+def get_exchange(name: str, session: aiohttp.ClientSession | None = None) -> Any:
+    """Initialize an async CCXT exchange instance with rate limiting enabled.
+
+    The instance must be closed with ``await ex.close()`` once collection ends.
+    When ``session`` is given it is used for all requests and stays owned by the
+    caller; otherwise ccxt creates (and closes) its own aiohttp session.
 
     Raises
     ------
@@ -103,7 +152,49 @@ def get_exchange(name: str) -> Any:
     ex_class = getattr(ccxt, name, None)
     if ex_class is None:
         raise SystemExit(f"Exchange not supported by ccxt: {name}")
-    return ex_class({"enableRateLimit": True})
+    config: dict[str, Any] = {"enableRateLimit": True}
+    if session is not None:
+        config["session"] = session
+    return ex_class(config)
+
+
+async def fetch_with_backoff(
+    ex: Any, fetch: Any, *args: Any, retries: int = 5, **kwargs: Any
+) -> Any:
+    """Await an exchange call, retrying with exponential backoff when rate-limited.
+
+    Parameters
+    ----------
+    ex : Any
+        Async CCXT exchange instance (its ``rateLimit`` seeds the backoff).
+    fetch : Any
+        Bound coroutine method of ``ex`` (e.g., ``ex.fetch_ohlcv``).
+    *args : Any
+        Positional arguments for ``fetch``.
+    retries : int, default=5
+        Maximum number of attempts.
+    **kwargs : Any
+        Keyword arguments for ``fetch``.
+
+    Returns
+    -------
+    Any
+        Result of ``fetch``.
+
+    Notes
+    -----
+    Spacing between requests is enforced by ccxt (``enableRateLimit``); this
+    only waits when the exchange actually rejects a request as rate-limited.
+    """
+    delay_s = ex.rateLimit / 1000
+    for attempt in range(retries):
+        try:
+            return await fetch(*args, **kwargs)
+        except ccxt.RateLimitExceeded:
+            if attempt == retries - 1:
+                raise
+            await asyncio.sleep(delay_s)
+            delay_s *= 2
 
 
 # -----------------------------
@@ -111,21 +202,22 @@ def get_exchange(name: str) -> Any:
 # -----------------------------
 
 
-def fetch_ohlcv_all(
+async def fetch_ohlcv_all(
     ex: Any,
     symbol: str,
     timeframe: str,
     since_ms: int,
     until_ms: int,
     limit: int = 1000,
-    sleep_s: float = 0.2,
+    sleep_s: float = 0.0,
+    concurrency: int = 8,
 ) -> pd.DataFrame:
-    """Collect OHLCV data in batches.
+    """Collect OHLCV data in concurrent, pre-computed time windows.
 
     Parameters
     ----------
     ex : Any
-        CCXT exchange instance.
+        Async CCXT exchange instance.
     symbol : str
         Trading symbol (e.g., 'BTC/USDT').
     timeframe : str
@@ -136,8 +228,11 @@ def fetch_ohlcv_all(
         End timestamp in milliseconds.
     limit : int, default=1000
         Pagination limit.
-    sleep_s : float, default=0.2
-        Sleep duration between requests in seconds.
+    sleep_s : float, default=0.0
+        Extra pause after each request, per in-flight slot, in seconds (safety
+        cap only; spacing is normally left to the exchange rate limiter).
+    concurrency : int, default=8
+        Maximum number of requests in flight at once.
 
     Returns
     -------
@@ -148,35 +243,65 @@ def fetch_ohlcv_all(
     -----
     OHLCV defines regimes (volatility / drawdowns / trend changes).
     Since/until boundaries are explicit in UTC.
-    Data is de-duplicated and ordered by timestamp.
+    Candle boundaries are known in advance, so [since, until) is split into
+    windows of ``limit`` candles that are fetched concurrently; the exchange
+    rate limiter still spaces the requests. A window is paginated further when
+    the exchange returns fewer candles per request than ``limit``.
+    Each batch is trimmed to its own window, so the windows are disjoint and
+    concatenating them in order is already de-duplicated and sorted by timestamp.
     """
-    rows: list[list[Any]] = []
-    cursor = since_ms
-
-    pbar = tqdm(desc="OHLCV", unit="batch")
-    while cursor < until_ms:
-        batch = ex.fetch_ohlcv(symbol, timeframe=timeframe, since=cursor, limit=limit)
-        if not batch:
-            break
-        rows.extend(batch)
-
-        last_ts = int(batch[-1][0])
-        if last_ts <= cursor:
-            cursor += 60_000
-        else:
-            cursor = last_ts + 1
-
+    tf_ms = ex.parse_timeframe(timeframe) * 1000
+    span_ms = limit * tf_ms
+    windows = [(s, min(s + span_ms, until_ms)) for s in range(since_ms, until_ms, span_ms)]
+
+    sem = asyncio.Semaphore(concurrency)
+    pbar = tqdm(total=len(windows), desc="OHLCV", unit="batch")
+
+    async def fetch_window(start: int, end: int) -> np.ndarray:
+        """Fetch one window and keep only candles inside [start, end) as a float array.
+
+        Exchanges that cap a request below ``limit`` return a partial window, so
+        the window is paginated from ``last_ts + tf_ms`` until it reaches ``end``
+        or the exchange returns no further candles.
+        """
+        parts: list[list[Any]] = []
+        cursor = start
+        while cursor < end:
+            async with sem:
+                batch = await fetch_with_backoff(
+                    ex, ex.fetch_ohlcv, symbol, timeframe=timeframe, since=cursor, limit=limit
+                )
+                await asyncio.sleep(sleep_s)
+            # Exchange batches are ascending by timestamp: slice instead of filtering.
+            lo = bisect.bisect_left(batch, cursor, key=itemgetter(0))
+            hi = bisect.bisect_left(batch, end, lo=lo, key=itemgetter(0))
+            if hi == lo:
+                break
+            parts.extend(batch[lo:hi])
+            if hi < len(batch):
+                break
+            cursor = int(batch[hi - 1][0]) + tf_ms
         pbar.update(1)
-        time.sleep(sleep_s)
-
-        if last_ts >= until_ms:
-            break
+        return np.asarray(parts, dtype=np.float64).reshape(-1, 6)
 
+    batches = await asyncio.gather(*(fetch_window(s, e) for s, e in windows))
     pbar.close()
 
-    df = pd.DataFrame(rows, columns=["ts", "open", "high", "low", "close", "volume"])
-    df = df.drop_duplicates(subset=["ts"]).sort_values("ts").reset_index(drop=True)
-    df["dt_utc"] = df["ts"].apply(iso_utc_from_ms)
+    # Contiguous buffer sized for the whole window (ms epochs are exact in float64).
+    buf = np.empty(((until_ms - since_ms) // tf_ms + limit, 6), dtype=np.float64)
+    n = 0
+    for arr in batches:
+        k = arr.shape[0]
+        buf[n : n + k] = arr
+        n += k
+
+    # Disjoint, ordered windows: strictly increasing ts means sorted and unique,
+    # checked in O(n) without hashing the column.
+    if n > 1 and not (np.diff(buf[:n, 0]) > 0).all():
+        raise SystemExit("OHLCV timestamps are not strictly increasing across windows.")
+
+    df = pd.DataFrame(buf[:n], columns=["ts", "open", "high", "low", "close", "volume"])
+    df["ts"] = df["ts"].astype(np.int64)
     return df
 
 
@@ -185,13 +310,13 @@ def fetch_ohlcv_all(
 # -----------------------------
 
 
-def fetch_trades_all(
+async def fetch_trades_all(
     ex: Any,
     symbol: str,
     since_ms: int,
     until_ms: int,
     limit: int = 1000,
-    sleep_s: float = 0.2,
+    sleep_s: float = 0.0,
     max_rows: int = 200_000,
 ) -> pd.DataFrame:
     """Collect trade data (API-limited on many exchanges).
@@ -199,7 +324,7 @@ def fetch_trades_all(
     Parameters
     ----------
     ex : Any
-        CCXT exchange instance.
+        Async CCXT exchange instance.
     symbol : str
         Trading symbol.
     since_ms : int
@@ -208,8 +333,8 @@ def fetch_trades_all(
         End timestamp in milliseconds.
     limit : int, default=1000
         Pagination limit.
-    sleep_s : float, default=0.2
-        Sleep duration between requests.
+    sleep_s : float, default=0.0
+        Extra pause between requests in seconds (safety cap only).
     max_rows : int, default=200_000
         Maximum number of trades to collect.
 
@@ -223,16 +348,38 @@ def fetch_trades_all(
     Trades provide λ proxy (arrival intensity).
     Inter-arrival distributions can be heavy-tailed.
     Many exchanges limit historical depth; limitations are recorded in the manifest.
+    Pagination is cursor-based, so batches stay sequential; the next batch is
+    requested before the current one is processed (double-buffering).
     """
-    rows: list[dict[str, Any]] = []
+
+    async def fetch_batch(since: int, delay_s: float) -> list[dict[str, Any]]:
+        """Fetch one trades batch starting at ``since`` after ``delay_s`` seconds."""
+        await asyncio.sleep(delay_s)
+        return await fetch_with_backoff(ex, ex.fetch_trades, symbol, since=since, limit=limit)
+
+    # Columnar accumulation: one typed list per field instead of a dict per trade.
+    ts_list: list[int] = []
+    price_list: list[float | None] = []
+    amount_list: list[float | None] = []
+    side_list: list[str | None] = []
+    id_list: list[str | None] = []
     cursor = since_ms
 
     pbar = tqdm(desc="TRADES", unit="batch")
-    while cursor < until_ms and len(rows) < max_rows:
-        batch = ex.fetch_trades(symbol, since=cursor, limit=limit)
+    pending: asyncio.Task | None = asyncio.create_task(fetch_batch(cursor, 0.0))
+    while pending is not None:
+        batch = await pending
+        pending = None
         if not batch:
             break
 
+        last_ts = int(batch[-1]["timestamp"])
+        cursor = last_ts + 1 if last_ts > cursor else cursor + 1
+        if cursor < until_ms:
+            pending = asyncio.create_task(fetch_batch(cursor, sleep_s))
+            # Yield once so the prefetch is dispatched before rows are processed.
+            await asyncio.sleep(0)
+
         for t in batch:
             ts = t.get("timestamp")
             if ts is None:
@@ -240,30 +387,33 @@ def fetch_trades_all(
             ts = int(ts)
             if ts > until_ms:
                 continue
-            rows.append(
-                {
-                    "ts": ts,
-                    "price": float(t.get("price", np.nan)),
-                    "amount": float(t.get("amount", np.nan)),
-                    "side": t.get("side"),
-                    "trade_id": t.get("id"),
-                }
-            )
-
-        last_ts = int(batch[-1]["timestamp"])
-        cursor = last_ts + 1 if last_ts > cursor else cursor + 1
+            ts_list.append(ts)
+            price_list.append(t.get("price"))
+            amount_list.append(t.get("amount"))
+            side_list.append(t.get("side"))
+            id_list.append(t.get("id"))
 
         pbar.update(1)
-        time.sleep(sleep_s)
 
-    pbar.close()
+        if pending is not None and len(ts_list) >= max_rows:
+            pending.cancel()
+            pending = None
 
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return df
+    pbar.close()
 
+    # None sentinels become NaN / <NA> during the typed conversion.
+    # side is low-cardinality (buy/sell) and is stored as a parquet dictionary.
+    # Prices stay float64: float32 cannot represent quote prices to the cent.
+    df = pd.DataFrame(
+        {
+            "ts": np.fromiter(ts_list, dtype=np.int64, count=len(ts_list)),
+            "price": np.asarray(price_list, dtype=np.float64),
+            "amount": np.asarray(amount_list, dtype=np.float64),
+            "side": pd.Categorical(side_list),
+            "trade_id": pd.array(id_list, dtype="string[pyarrow]"),
+        }
+    )
     df = df.drop_duplicates(subset=["ts", "trade_id"]).sort_values("ts").reset_index(drop=True)
-    df["dt_utc"] = df["ts"].apply(iso_utc_from_ms)
     return df
 
 
@@ -272,6 +422,54 @@ def fetch_trades_all(
 # -----------------------------
 
 
+async def collect(
+    args: argparse.Namespace, now: dt.datetime
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """Run the network-bound collection stages on a single async exchange client.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command-line arguments.
+    now : dt.datetime
+        UTC reference instant closing both collection windows.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame | None]
+        OHLCV frame and, if enabled, the trades frame.
+    """
+    now_ms = utc_ms(now)
+    trades = None
+
+    async with open_http_session(int(args.concurrency)) as session:
+        ex = get_exchange(args.exchange, session=session)
+        try:
+            ohlcv = await fetch_ohlcv_all(
+                ex,
+                args.symbol,
+                args.timeframe,
+                since_ms=utc_ms(now - dt.timedelta(days=int(args.ohlcv_days))),
+                until_ms=now_ms,
+                sleep_s=float(args.sleep_s),
+                concurrency=int(args.concurrency),
+            )
+
+            if args.with_trades:
+                trades = await fetch_trades_all(
+                    ex,
+                    args.symbol,
+                    since_ms=utc_ms(now - dt.timedelta(days=int(args.trades_days))),
+                    until_ms=now_ms,
+                    max_rows=int(args.max_trades),
+                    sleep_s=float(args.sleep_s),
+                )
+        finally:
+            await ex.close()
+
+    return ohlcv, trades
+
+
 def main():
     """Execute the data collection pipeline for Phase 1 public market data."""
     ap = argparse.ArgumentParser(
@@ -287,7 +485,8 @@ def main():
     ap.add_argument("--with_trades", action="store_true")
     ap.add_argument("--trades_days", type=int, default=14)
     ap.add_argument("--max_trades", type=int, default=200_000)
-    ap.add_argument("--sleep_s", type=float, default=0.2)
+    ap.add_argument("--sleep_s", type=float, default=0.0)
+    ap.add_argument("--concurrency", type=int, default=8, help="Max in-flight OHLCV requests.")
     args = ap.parse_args()
 
     run_dir = Path("runs") / args.run_id
@@ -296,45 +495,25 @@ def main():
 
     manifest = load_manifest(run_dir)
 
-    ex = get_exchange(args.exchange)
-
     now = dt.datetime.now(dt.UTC)
     ohlcv_since = now - dt.timedelta(days=int(args.ohlcv_days))
-    ohlcv_since_ms = utc_ms(ohlcv_since)
-    now_ms = utc_ms(now)
 
-    # Collect OHLCV
-    ohlcv = fetch_ohlcv_all(
-        ex,
-        args.symbol,
-        args.timeframe,
-        since_ms=ohlcv_since_ms,
-        until_ms=now_ms,
-        sleep_s=float(args.sleep_s),
-    )
+    ohlcv, trades = asyncio.run(collect(args, now))
+
     ohlcv_path = (
         run_dir / f"ohlcv_{args.exchange}_{args.symbol.replace('/', '-')}_{args.timeframe}.parquet"
     )
-    ohlcv.to_parquet(ohlcv_path, index=False)
+    write_parquet(ohlcv, ohlcv_path)
 
-    # Collect trades (optional)
+    # Trades (optional)
     trades_path: Path | None = None
     trades_rows = 0
     trades_window = None
 
-    if args.with_trades:
+    if trades is not None:
         trades_since = now - dt.timedelta(days=int(args.trades_days))
-        trades_since_ms = utc_ms(trades_since)
-        trades = fetch_trades_all(
-            ex,
-            args.symbol,
-            since_ms=trades_since_ms,
-            until_ms=now_ms,
-            max_rows=int(args.max_trades),
-            sleep_s=float(args.sleep_s),
-        )
         trades_path = run_dir / f"trades_{args.exchange}_{args.symbol.replace('/', '-')}.parquet"
-        trades.to_parquet(trades_path, index=False)
+        write_parquet(trades, trades_path)
         trades_rows = int(len(trades))
         trades_window = {
             "since_utc": trades_since.isoformat(),
@@ -359,6 +538,7 @@ def main():
             "note": "Trades depth may be limited by exchange API policies.",
         },
         "sleep_s": float(args.sleep_s),
+        "concurrency": int(args.concurrency),
     }
 
     # Artifacts list (relative)
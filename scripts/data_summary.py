@@ -16,14 +16,22 @@ Scientific intent:
 from __future__ import annotations
 
 import argparse
+import csv
 import datetime as dt
+import io
 import json
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from hash_utils import save_json, write_checksums_sha256
 
+try:  # optional accelerator for the moment sweep
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 def utcnow_iso() -> str:
     """Return current UTC time as an ISO-8601 string.
@@ -101,14 +109,53 @@ def _quantiles(x: np.ndarray, qs=(0.01, 0.05, 0.50, 0.95, 0.99)) -> dict[str, fl
     x = x[np.isfinite(x)]
     if x.size == 0:
         return {f"q{int(q * 100):02d}": float("nan") for q in qs}
-    out = {}
-    for q in qs:
-        out[f"q{int(q * 100):02d}"] = float(np.quantile(x, q))
-    return out
+    # One call sorts/partitions once for all requested quantiles.
+    vals = np.quantile(x, np.asarray(qs))
+    return {f"q{int(q * 100):02d}": float(v) for q, v in zip(qs, vals, strict=True)}
+
+
+def _central_sums(x: np.ndarray) -> tuple[int, float, float, float]:
+    """Accumulate count, mean and 2nd/4th central sums in a single sweep.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Finite float64 values.
 
+    Returns
+    -------
+    tuple[int, float, float, float]
+        ``(n, mean, M2, M4)`` with ``Mk = sum((x - mean) ** k)``.
 
-def _safe_kurtosis(x: np.ndarray) -> float:
-    """Compute Pearson's kurtosis robust to small sample sizes or zero variance.
+    Notes
+    -----
+    Online (Welford/Terriberry) update; M3 is tracked because the M4 update
+    depends on it. Compiled with Numba when available.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for v in x:
+        n1 = n
+        n += 1
+        delta = v - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+        mean += delta_n
+        m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6.0 * delta_n2 * m2 - 4.0 * delta_n * m3
+        m3 += term1 * delta_n * (n - 2) - 3.0 * delta_n * m2
+        m2 += term1
+    return n, mean, m2, m4
+
+
+_central_sums_jit = njit(cache=True, fastmath=True)(_central_sums) if njit is not None else None
+
+
+def _moments(x: np.ndarray) -> tuple[float, float, float]:
+    """Compute mean, population std and Pearson's kurtosis of the finite values.
 
     Parameters
     ----------
@@ -117,34 +164,127 @@ def _safe_kurtosis(x: np.ndarray) -> float:
 
     Returns
     -------
-    float
-        Kurtosis value, or NaN if sample size < 4 or variance is zero.
+    tuple[float, float, float]
+        ``(mean, std, kurtosis)``. Mean/std are NaN for empty input; kurtosis is
+        NaN if sample size < 4 or variance is zero.
     """
-    x = x[np.isfinite(x)]
-    if x.size < 4:
-        return float("nan")
-    m = x.mean()
-    v = np.mean((x - m) ** 2)
-    if v <= 0:
-        return float("nan")
-    k = np.mean((x - m) ** 4) / (v**2)
-    return float(k)
+    x = np.ascontiguousarray(x[np.isfinite(x)], dtype=np.float64)
+    if x.size == 0:
+        return float("nan"), float("nan"), float("nan")
+
+    if _central_sums_jit is not None:
+        n, mean, m2, m4 = _central_sums_jit(x)
+    else:
+        # NumPy fallback: one centered buffer reused for the 2nd and 4th powers.
+        n = x.size
+        mean = x.mean()
+        d2 = x - mean
+        d2 *= d2
+        m2 = d2.sum()
+        d2 *= d2
+        m4 = d2.sum()
+
+    v = m2 / n
+    kurt = n * m4 / (m2 * m2) if n >= 4 and v > 0 else float("nan")
+    return float(mean), float(np.sqrt(v)), float(kurt)
+
+
+def _iso_utc_from_ms(ms: int) -> str:
+    """Convert Unix epoch milliseconds to an ISO-8601 UTC timestamp string.
+
+    Parameters
+    ----------
+    ms : int
+        Unix epoch timestamp in milliseconds.
+
+    Returns
+    -------
+    str
+        ISO-8601 formatted UTC timestamp.
+    """
+    return dt.datetime.fromtimestamp(ms / 1000, tz=dt.UTC).isoformat()
+
+
+def _utc_bounds(ts: np.ndarray) -> tuple[str, str]:
+    """Format the first and last epoch-ms timestamps as ISO-8601 UTC strings.
+
+    Parameters
+    ----------
+    ts : np.ndarray
+        Unix epoch timestamps in milliseconds (NaN marks missing values).
+
+    Returns
+    -------
+    tuple[str, str]
+        ``(start_utc, end_utc)``, or ``("NaT", "NaT")`` if no timestamp is valid.
+    """
+    if ts.dtype.kind == "f":
+        ts = ts[~np.isnan(ts)]
+    if ts.size == 0:
+        return "NaT", "NaT"
+    return _iso_utc_from_ms(int(ts.min())), _iso_utc_from_ms(int(ts.max()))
+
+
+def _num(s: pd.Series) -> np.ndarray:
+    """Return a column as a NumPy array, coercing only non-numeric dtypes.
 
+    Parameters
+    ----------
+    s : pd.Series
+        Input column.
+
+    Returns
+    -------
+    np.ndarray
+        Native numeric array for numeric columns (no copy, no scan); otherwise a
+        float64 array with unparseable values as NaN.
+    """
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_extension_array_dtype(s):
+        return s.to_numpy(copy=False)
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
 
-def _to_utc_dt(series_like) -> pd.Series:
-    """Convert a series-like object to UTC datetime.
+
+def read_parquet_columns(path: Path, wanted: tuple[str, ...]) -> tuple[pd.DataFrame, list[str]]:
+    """Read only the needed columns of a parquet artifact.
 
     Parameters
     ----------
-    series_like : pd.Series or array-like
-        Input data containing datetime-like values.
+    path : Path
+        Parquet file path.
+    wanted : tuple[str, ...]
+        Columns used by the summary; those absent from the file are skipped.
 
     Returns
     -------
-    pd.Series
-        Pandas Series converted to UTC datetime.
+    tuple[pd.DataFrame, list[str]]
+        Projected DataFrame and the full list of columns stored in the file.
     """
-    return pd.to_datetime(series_like, utc=True, errors="coerce")
+    columns = list(pq.read_schema(path).names)
+    df = pd.read_parquet(path, columns=[c for c in wanted if c in columns])
+    return df, columns
+
+
+def _sorted_by_ts(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the frame ordered by ``ts``, sorting only when it is not already.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame with a ``ts`` column.
+
+    Returns
+    -------
+    pd.DataFrame
+        Frame ordered by ``ts`` with a default RangeIndex.
+
+    Notes
+    -----
+    collect_data.py writes artifacts in timestamp order, so the O(n)
+    monotonicity check usually replaces an O(n log n) sort.
+    """
+    if df["ts"].is_monotonic_increasing:
+        return df
+    return df.sort_values("ts", kind="stable", ignore_index=True)
 
 
 def find_artifact(manifest: dict, prefix: str, suffix: str) -> str | None:
@@ -170,13 +310,15 @@ def find_artifact(manifest: dict, prefix: str, suffix: str) -> str | None:
     return None
 
 
-def summarize_ohlcv(df: pd.DataFrame) -> dict[str, object]:
+def summarize_ohlcv(df: pd.DataFrame, columns: list[str] | None = None) -> dict[str, object]:
     """Compute descriptive statistics for OHLCV data.
 
     Parameters
     ----------
     df : pd.DataFrame
         DataFrame containing OHLCV data.
+    columns : list[str] | None, optional
+        Columns of the source artifact, when ``df`` is a column projection.
 
     Returns
     -------
@@ -187,40 +329,38 @@ def summarize_ohlcv(df: pd.DataFrame) -> dict[str, object]:
     -----
     Descriptive only; no causal claims. Includes log-return moments and quantiles.
     """
-    # Expect at least: ts, close; dt_utc may be string.
-    dt_series = (
-        _to_utc_dt(df["dt_utc"])
-        if "dt_utc" in df.columns
-        else _to_utc_dt(
-            df["ts"],
-        )
-    )
-    close = pd.to_numeric(df["close"], errors="coerce")
+    # Expect at least: ts, close. UTC bounds come from ts; no datetime column is parsed.
+    start_utc, end_utc = _utc_bounds(_num(df["ts"]))
+    close = _num(df["close"])
 
-    logret = np.log(close).diff().to_numpy()
+    lc = np.log(close)
+    logret = lc[1:] - lc[:-1]
     logret = logret[np.isfinite(logret)]
+    logret_mean, logret_std, logret_kurt = _moments(logret)
 
     out = {
         "rows": int(len(df)),
-        "start_utc": str(dt_series.min()),
-        "end_utc": str(dt_series.max()),
-        "columns": list(df.columns),
-        "missing_rate_close": float(close.isna().mean()),
-        "logret_mean": float(np.mean(logret)) if logret.size else float("nan"),
-        "logret_std": float(np.std(logret)) if logret.size else float("nan"),
-        "logret_kurtosis": _safe_kurtosis(logret),
+        "start_utc": start_utc,
+        "end_utc": end_utc,
+        "columns": list(df.columns) if columns is None else columns,
+        "missing_rate_close": float(np.isnan(close).mean()) if close.size else float("nan"),
+        "logret_mean": logret_mean,
+        "logret_std": logret_std,
+        "logret_kurtosis": logret_kurt,
         **{f"logret_{k}": v for k, v in _quantiles(logret).items()},
     }
     return out
 
 
-def summarize_trades(df: pd.DataFrame) -> dict[str, object]:
+def summarize_trades(df: pd.DataFrame, columns: list[str] | None = None) -> dict[str, object]:
     """Compute descriptive statistics for trade data.
 
     Parameters
     ----------
     df : pd.DataFrame
         DataFrame containing trade data.
+    columns : list[str] | None, optional
+        Columns of the source artifact, when ``df`` is a column projection.
 
     Returns
     -------
@@ -232,35 +372,34 @@ def summarize_trades(df: pd.DataFrame) -> dict[str, object]:
     Descriptive only. Inter-arrival is computed from timestamps (seconds).
     Intensity is aggregated as trades per minute (proxy of λ(t)).
     """
-    dt_series = _to_utc_dt(df["dt_utc"]) if "dt_utc" in df.columns else _to_utc_dt(df["ts"])
-    ts = pd.to_numeric(df["ts"], errors="coerce")
+    ts_arr = _num(df["ts"])
+    start_utc, end_utc = _utc_bounds(ts_arr)
 
-    # inter-arrival in seconds
-    inter = (ts.diff() / 1000.0).to_numpy()
-    inter = inter[np.isfinite(inter)]
-    inter = inter[inter > 0]
+    # inter-arrival in seconds (int64 diffs need no NaN handling)
+    diffs = np.diff(ts_arr)
+    if diffs.dtype.kind == "f":
+        diffs = diffs[np.isfinite(diffs)]
+    inter = diffs[diffs > 0] / 1000.0
+    inter_mean, inter_std, _ = _moments(inter)
 
-    # intensity proxy: trades/min
+    # intensity proxy: trades/min (non-empty UTC minute bars only)
     step_ms = 60_000
-    bar_ts = (ts // step_ms) * step_ms
-    intensity = (
-        pd.DataFrame({"bar_ts": bar_ts})
-        .dropna()
-        .astype({"bar_ts": "int64"})
-        .groupby("bar_ts")
-        .size()
-        .to_numpy()
-    )
+    bars = (ts_arr[np.isfinite(ts_arr)] // step_ms).astype(np.int64)
+    if bars.size:
+        counts = np.bincount((bars - bars.min()).astype(np.intp))
+        intensity = counts[counts > 0]
+    else:
+        intensity = np.empty(0, dtype=np.int64)
 
     out = {
         "rows": int(len(df)),
-        "start_utc": str(dt_series.min()),
-        "end_utc": str(dt_series.max()),
-        "columns": list(df.columns),
-        "missing_rate_ts": float(ts.isna().mean()),
+        "start_utc": start_utc,
+        "end_utc": end_utc,
+        "columns": list(df.columns) if columns is None else columns,
+        "missing_rate_ts": float(np.isnan(ts_arr).mean()) if ts_arr.size else float("nan"),
         "interarrival_count": int(inter.size),
-        "interarrival_mean_s": float(np.mean(inter)) if inter.size else float("nan"),
-        "interarrival_std_s": float(np.std(inter)) if inter.size else float("nan"),
+        "interarrival_mean_s": inter_mean,
+        "interarrival_std_s": inter_std,
         **{f"interarrival_s_{k}": v for k, v in _quantiles(inter).items()},
         "intensity_bars": int(intensity.size),
         "intensity_mean_trades_per_min": (
@@ -317,18 +456,20 @@ def main():
 
     # Load data
     try:
-        ohlcv = pd.read_parquet(ohlcv_path).sort_values("ts").reset_index(drop=True)
+        ohlcv, ohlcv_cols = read_parquet_columns(ohlcv_path, ("ts", "close"))
+        ohlcv = _sorted_by_ts(ohlcv)
     except Exception as e:
         raise SystemExit(f"Failed to read OHLCV parquet: {ohlcv_path} :: {e}") from e
 
-    ohlcv_sum = summarize_ohlcv(ohlcv)
+    ohlcv_sum = summarize_ohlcv(ohlcv, columns=ohlcv_cols)
 
     trades_sum = None
     if trades_rel:
         trades_path = run_dir / trades_rel
         try:
-            trades = pd.read_parquet(trades_path).sort_values("ts").reset_index(drop=True)
-            trades_sum = summarize_trades(trades)
+            trades, trades_cols = read_parquet_columns(trades_path, ("ts",))
+            trades = _sorted_by_ts(trades)
+            trades_sum = summarize_trades(trades, columns=trades_cols)
         except Exception as e:
             raise SystemExit(f"Failed to read trades parquet: {trades_path} :: {e}") from e
 
@@ -370,26 +511,31 @@ def main():
         for k, v in trades_sum.items():
             flat_rows.append((f"trades.{k}", v))
 
+    # NaN is written as an empty cell, as pandas.to_csv did.
     out_csv = tables_dir / "data_summary.csv"
-    pd.DataFrame(flat_rows, columns=["field", "value"]).to_csv(out_csv, index=False)
+    with out_csv.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(["field", "value"])
+        w.writerows((k, "" if isinstance(v, float) and np.isnan(v) else v) for k, v in flat_rows)
 
     # Write Markdown (Methods-ready)
-    md_parts = []
-    md_parts.append("# Data Summary — Phase 1\n")
-    md_parts.append(f"- **run_id:** `{args.run_id}`\n")
-    md_parts.append(f"- **generated_utc:** `{summary['generated_utc']}`\n")
-    md_parts.append(f"- **repository:** `{repo_url}`\n")
-    md_parts.append("\n## OHLCV (1m)\n")
-    md_parts.append(to_markdown_table([(k, ohlcv_sum[k]) for k in sorted(ohlcv_sum.keys())]))
+    md = io.StringIO()
+    md.write(
+        "# Data Summary — Phase 1\n"
+        f"- **run_id:** `{args.run_id}`\n"
+        f"- **generated_utc:** `{summary['generated_utc']}`\n"
+        f"- **repository:** `{repo_url}`\n"
+    )
+    md.write("\n## OHLCV (1m)\n")
+    md.write(to_markdown_table([(k, ohlcv_sum[k]) for k in sorted(ohlcv_sum.keys())]))
     if trades_sum:
-        md_parts.append("\n## Trades\n")
-        md_parts.append(to_markdown_table([(k, trades_sum[k]) for k in sorted(trades_sum.keys())]))
-    md_parts.append("\n## Notes\n")
-    for n in summary["notes"]:
-        md_parts.append(f"- {n}\n")
+        md.write("\n## Trades\n")
+        md.write(to_markdown_table([(k, trades_sum[k]) for k in sorted(trades_sum.keys())]))
+    md.write("\n## Notes\n")
+    md.write("".join(f"- {n}\n" for n in summary["notes"]))
 
     out_md = tables_dir / "data_summary.md"
-    out_md.write_text("".join(md_parts), encoding="utf-8")
+    out_md.write_text(md.getvalue(), encoding="utf-8")
 
     # Update manifest artifacts.tables
     manifest.setdefault("artifacts", {})
@@ -30,9 +30,29 @@ import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from _features_numba import fused_features
 from hash_utils import save_json, write_checksums_sha256
 
 matplotlib.use("Agg")
+# Agg rendering of long line plots: merge sub-pixel segments and stream paths in
+# bounded chunks. Histograms (bars) are unaffected.
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10000
+
+# Series longer than this are min/max-decimated to the output pixel width.
+DECIMATE_MIN_POINTS = 5000
+FIG_SIZE = (12, 6)
+FIG_DPI = 220
+# Axes margins (figure fraction); the bottom margin depends on the footer.
+MARGIN_LEFT = 0.08
+MARGIN_RIGHT = 0.98
+MARGIN_TOP = 0.93
+# Pillow PNG encoder settings (pixels are identical; only zlib effort differs).
+PNG_ENCODE = {
+    "fast": {"compress_level": 1, "optimize": False},
+    "small": {"compress_level": 6, "optimize": False},
+}
 
 # -----------------------------
 # IO + logging
@@ -134,32 +154,137 @@ def ensure_figdir(run_dir: Path) -> Path:
     return figdir
 
 
+def load_sorted(path: Path, columns: list[str]) -> pd.DataFrame:
+    """Read parquet columns and ensure ``ts`` order, sorting only if needed.
+
+    Parameters
+    ----------
+    path : Path
+        Parquet artifact path.
+    columns : list[str]
+        Columns to read (must include ``ts``).
+
+    Returns
+    -------
+    pd.DataFrame
+        Frame ordered by ``ts`` with a default RangeIndex.
+
+    Notes
+    -----
+    Artifacts are written in collection order, so the O(n) monotonicity check
+    normally replaces an O(n log n) sort.
+    """
+    df = pd.read_parquet(path, engine="pyarrow", columns=columns)
+    if df["ts"].is_monotonic_increasing:
+        return df
+    return df.sort_values("ts", kind="stable", ignore_index=True)
+
+
 # -----------------------------
 # Math
 # -----------------------------
 
 
-def realized_vol(close: pd.Series, window: int) -> pd.Series:
+def realized_vol(ret: np.ndarray, window: int) -> np.ndarray:
     """Compute realized volatility as the rolling standard deviation of log returns.
 
     Parameters
     ----------
-    close : pd.Series
-        Time series of close prices.
+    ret : np.ndarray
+        Log returns aligned with the close series (``ret[0]`` is NaN).
     window : int
         Rolling window size.
 
     Returns
     -------
-    pd.Series
-        Realized volatility series scaled by sqrt(window).
+    np.ndarray
+        Realized volatility series scaled by sqrt(window), aligned with ``ret``.
 
     Notes
     -----
     Used as a regime proxy. Descriptive only; no causal claims.
+    Computed in O(n) from prefix sums of r and r**2 (sample std, ddof=1); a
+    window containing a non-finite return is NaN, matching
+    ``r.rolling(window).std()``.
+    """
+    r = ret[1:]
+    valid = np.isfinite(r)
+    r = np.where(valid, r, 0.0)
+
+    c0 = np.concatenate(([0], np.cumsum(valid)))
+    c1 = np.concatenate(([0.0], np.cumsum(r)))
+    c2 = np.concatenate(([0.0], np.cumsum(r * r)))
+
+    out = np.full(ret.size, np.nan)
+    if window >= 2 and r.size >= window:
+        count = c0[window:] - c0[:-window]
+        s1 = c1[window:] - c1[:-window]
+        s2 = c2[window:] - c2[:-window]
+        var = np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0)
+        var[count < window] = np.nan
+        out[window:] = np.sqrt(var) * np.sqrt(window)
+    return out
+
+
+def compute_features(
+    close: np.ndarray, w1: int = 30, w2: int = 120
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute log drawdown and two realized-volatility windows from close prices.
+
+    Parameters
+    ----------
+    close : np.ndarray
+        Close prices (float32 or float64).
+    w1 : int, default=30
+        First realized-volatility window.
+    w2 : int, default=120
+        Second realized-volatility window.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        ``(drawdown, rv_w1, rv_w2)`` aligned with ``close``.
+
+    Notes
+    -----
+    Uses the fused single-pass Numba kernel when Numba is installed; otherwise
+    the equivalent vectorized NumPy path below. Returns are taken as log price
+    ratios, which stay accurate for float32 close (the difference of two float32
+    logs would not), and all outputs are float64.
+    """
+    if fused_features is not None:
+        return fused_features(close, w1, w2)
+
+    ret = np.empty(close.size)
+    ret[:1] = np.nan
+    ret[1:] = np.log(close[1:] / close[:-1])
+    # Non-finite returns (zero or missing close) are missing, as in the kernel.
+    ret[~np.isfinite(ret)] = np.nan
+    cumret = np.nancumsum(ret)
+    drawdown = cumret - np.maximum.accumulate(cumret)
+    return drawdown, realized_vol(ret, w1), realized_vol(ret, w2)
+
+
+def _to_utc_dt(s: pd.Series) -> pd.Series:
+    """Convert a timestamp column to ``datetime64[ns, UTC]`` without format inference.
+
+    Parameters
+    ----------
+    s : pd.Series
+        Epoch milliseconds (integer), datetimes (tz-aware or naive UTC) or ISO strings.
+
+    Returns
+    -------
+    pd.Series
+        UTC datetime series (unparseable strings become NaT).
     """
-    r = np.log(close).diff()
-    return r.rolling(window).std() * np.sqrt(window)
+    if pd.api.types.is_integer_dtype(s):
+        return pd.to_datetime(s, unit="ms", utc=True)
+    if isinstance(s.dtype, pd.DatetimeTZDtype):
+        return s.dt.tz_convert("UTC")
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.dt.tz_localize("UTC")
+    return pd.to_datetime(s, utc=True, errors="coerce", format="ISO8601")
 
 
 # -----------------------------
@@ -290,35 +415,116 @@ def _compute_bottom_margin(n_footer_lines: int) -> float:
     return min(0.10 + 0.03 * (n_footer_lines - 1), 0.21)
 
 
-def save_figure(fig: plt.Figure, out_path: Path, footer_lines: list[str], dpi: int = 220) -> None:
-    """Save a Matplotlib figure with provenance metadata and publication-grade formatting.
+def _decimate_minmax(
+    x: pd.Series | np.ndarray, y: np.ndarray, n_buckets: int
+) -> tuple[pd.Series | np.ndarray, np.ndarray]:
+    """Reduce a series to the min and max sample of each of ``n_buckets`` index buckets.
+
+    Parameters
+    ----------
+    x : pd.Series | np.ndarray
+        X values aligned with ``y``.
+    y : np.ndarray
+        Values to plot.
+    n_buckets : int
+        Number of buckets (typically the horizontal pixel count of the axes).
+
+    Returns
+    -------
+    tuple[pd.Series | np.ndarray, np.ndarray]
+        Subsampled ``(x, y)`` in original order; unchanged when ``y`` is short.
+
+    Notes
+    -----
+    Per-bucket extremes are what a line can show at pixel resolution, so the
+    rendered envelope (spikes, drawdown troughs) is preserved while the path
+    handed to Matplotlib shrinks to ~2 points per pixel column. All-NaN buckets
+    keep a NaN sample, so gaps in the line survive.
+    """
+    n = y.size
+    if n <= max(DECIMATE_MIN_POINTS, 2 * n_buckets):
+        return x, y
+
+    k = n // n_buckets
+    m = k * n_buckets
+    blocks = y[:m].reshape(n_buckets, k)
+    nan = np.isnan(blocks)
+    lo = np.where(nan, np.inf, blocks).argmin(axis=1)
+    hi = np.where(nan, -np.inf, blocks).argmax(axis=1)
+    base = np.arange(n_buckets) * k
+    idx = np.sort(np.stack([base + lo, base + hi], axis=1), axis=1).ravel()
+    idx = np.concatenate([idx, np.arange(m, n)])
+
+    x_sub = x.iloc[idx] if isinstance(x, pd.Series) else x[idx]
+    return x_sub, y[idx]
+
+
+class FigureRecycler:
+    """One reusable figure/axes pair with the provenance footer rendered once.
+
+    Every EDA figure shares the canvas size, margins and footer, so the figure,
+    footer artist and margins are built once per run. Plot helpers draw on
+    ``ax``; ``save_and_reset`` writes the PNG and clears the axes for the next
+    figure (the footer, a figure-level artist, is kept).
 
     Parameters
     ----------
-    fig : plt.Figure
-        Matplotlib figure object.
-    out_path : Path
-        Destination path.
     footer_lines : list[str]
         Lines of text for the provenance footer.
-    dpi : int, default=220
-        Resolution for the output image.
+    dpi : int, default=FIG_DPI
+        Resolution for the output images.
+    png_encode : str, default="fast"
+        Key of ``PNG_ENCODE``: ``"fast"`` (zlib level 1) or ``"small"`` (level 6).
     """
-    n_lines = _add_footer(fig, footer_lines)
-    bottom = _compute_bottom_margin(n_lines)
-    fig.subplots_adjust(bottom=bottom)
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out_path, dpi=dpi, bbox_inches="tight")
-    plt.close(fig)
+    def __init__(
+        self, footer_lines: list[str], dpi: int = FIG_DPI, png_encode: str = "fast"
+    ) -> None:
+        """Create the shared figure, render the footer and fix the margins.
+
+        Parameters
+        ----------
+        footer_lines : list[str]
+            Lines of text for the provenance footer.
+        dpi : int, default=FIG_DPI
+            Resolution for the output images.
+        png_encode : str, default="fast"
+            Key of ``PNG_ENCODE``.
+        """
+        self.fig, self.ax = plt.subplots(figsize=FIG_SIZE)
+        self.dpi = dpi
+        self.pil_kwargs = PNG_ENCODE[png_encode]
+        n_lines = _add_footer(self.fig, footer_lines)
+        bottom = _compute_bottom_margin(n_lines)
+        # Fixed margins: a single render pass, no tight-bbox measuring pass.
+        self.fig.set_layout_engine("none")
+        self.fig.subplots_adjust(
+            left=MARGIN_LEFT, right=MARGIN_RIGHT, top=MARGIN_TOP, bottom=bottom
+        )
+
+    def save_and_reset(self, out_path: Path) -> None:
+        """Save the current figure and clear the axes for the next plot.
+
+        Parameters
+        ----------
+        out_path : Path
+            Destination path.
+        """
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fig.savefig(out_path, dpi=self.dpi, pil_kwargs=self.pil_kwargs)
+        self.ax.clear()
+
+    def close(self) -> None:
+        """Release the shared figure."""
+        plt.close(self.fig)
 
 
 def plot_series_datetime(
+    rec: FigureRecycler,
     x_dt: pd.Series,
     y: np.ndarray,
     title: str,
     out_path: Path,
-    footer_lines: list[str],
     xlabel: str = "",
     ylabel: str = "",
 ) -> None:
@@ -326,76 +532,82 @@ def plot_series_datetime(
 
     Parameters
     ----------
+    rec : FigureRecycler
+        Shared figure (footer, margins, encoder settings).
     x_dt : pd.Series
-        Datetime series (UTC).
+        Datetime series (UTC). A ``datetime64[ns, UTC]`` series is used as is;
+        anything else goes through ``_to_utc_dt``.
     y : np.ndarray
         Values to plot.
     title : str
         Figure title.
     out_path : Path
         Output file path.
-    footer_lines : list[str]
-        Provenance metadata.
     xlabel : str, optional
         X-axis label.
     ylabel : str, optional
         Y-axis label.
     """
-    x = pd.to_datetime(x_dt, utc=True, errors="coerce")
-    if x.isna().all():
-        x_plot = np.arange(len(y))
+    if isinstance(x_dt.dtype, pd.DatetimeTZDtype):
+        x = x_dt
     else:
-        x_plot = x
+        x = _to_utc_dt(pd.Series(x_dt))
+    has_dt = not x.isna().all()
+    x_plot = x if has_dt else np.arange(len(y))
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.plot(x_plot, y, linewidth=1.2)
+    ax = rec.ax
+    ax.plot(*_decimate_minmax(x_plot, y, FIG_SIZE[0] * FIG_DPI), linewidth=1.2)
     ax.set_title(title)
     if xlabel:
         ax.set_xlabel(xlabel)
     if ylabel:
         ax.set_ylabel(ylabel)
 
-    if not x.isna().all():
+    if has_dt:
         _format_datetime_axis(ax)
 
     _apply_common_style(ax)
-    fig.tight_layout()
-    save_figure(fig, out_path, footer_lines=footer_lines, dpi=220)
+    rec.save_and_reset(out_path)
 
 
-def plot_hist(
-    values: np.ndarray,
+def plot_hist_precomputed(
+    rec: FigureRecycler,
+    counts: np.ndarray,
+    edges: np.ndarray,
     title: str,
     out_path: Path,
-    footer_lines: list[str],
-    bins: int = 120,
     logy: bool = False,
     xlabel: str = "",
     ylabel: str = "",
 ) -> None:
-    """Plot a histogram with optional log-scale y-axis and provenance footer.
+    """Plot an already-binned histogram (``np.histogram`` output) as bars.
 
     Parameters
     ----------
-    values : np.ndarray
-        Data array.
+    rec : FigureRecycler
+        Shared figure (footer, margins, encoder settings).
+    counts : np.ndarray
+        Bin counts.
+    edges : np.ndarray
+        Bin edges (``len(counts) + 1``).
     title : str
         Figure title.
     out_path : Path
         Output file path.
-    footer_lines : list[str]
-        Provenance metadata.
-    bins : int, default=120
-        Number of histogram bins.
     logy : bool, default=False
         If True, use log scale for y-axis.
     xlabel : str, optional
         X-axis label.
     ylabel : str, optional
         Y-axis label.
+
+    Notes
+    -----
+    Binning once lets several figures (e.g. linear and log-y) share one pass
+    over the data; the bars match ``ax.hist`` with the same bins.
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.hist(values, bins=bins)
+    ax = rec.ax
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge")
     ax.set_title(title)
     if xlabel:
         ax.set_xlabel(xlabel)
@@ -405,8 +617,7 @@ def plot_hist(
         ax.set_yscale("log")
 
     _apply_common_style(ax)
-    fig.tight_layout()
-    save_figure(fig, out_path, footer_lines=footer_lines, dpi=220)
+    rec.save_and_reset(out_path)
 
 
 # -----------------------------
@@ -418,6 +629,20 @@ def main() -> None:
     """Execute the EDA pipeline to generate publication-grade figures."""
     ap = argparse.ArgumentParser(description="Generate publish-grade EDA figures for a run.")
     ap.add_argument("--run_id", type=str, required=True)
+    ap.add_argument(
+        "--precision",
+        type=str,
+        default="f32",
+        choices=["f32", "f64"],
+        help="In-memory dtype of close for the EDA (parquet is untouched).",
+    )
+    ap.add_argument(
+        "--png_encode",
+        type=str,
+        default="fast",
+        choices=sorted(PNG_ENCODE),
+        help="PNG zlib effort: fast (level 1, local iteration) or small (level 6, export).",
+    )
     args = ap.parse_args()
 
     run_dir = Path("runs") / args.run_id
@@ -467,29 +692,33 @@ def main() -> None:
 
     # Load OHLCV
     t = step("Loading OHLCV parquet", log_path=eda_log_path)
-    ohlcv = pd.read_parquet(ohlcv_path).sort_values("ts").reset_index(drop=True)
+    ohlcv = load_sorted(ohlcv_path, ["ts", "close"])
+    # Only ts/close are read; UTC datetimes are derived once from epoch-ms and
+    # reused by every OHLCV figure.
+    ohlcv_dt = _to_utc_dt(ohlcv["ts"])
     log(f"OHLCV loaded: rows={len(ohlcv)} in {time.perf_counter() - t:.2f}s", log_path=eda_log_path)
 
     # Compute features
     t = step("Computing returns, drawdown, realized volatility", log_path=eda_log_path)
-    ohlcv["ret"] = np.log(ohlcv["close"]).diff()
-    ohlcv["cumret"] = ohlcv["ret"].fillna(0).cumsum()
-    ohlcv["drawdown"] = ohlcv["cumret"] - ohlcv["cumret"].cummax()
-    ohlcv["rv_30"] = realized_vol(ohlcv["close"], 30)
-    ohlcv["rv_120"] = realized_vol(ohlcv["close"], 120)
+    # Contiguous arrays; only plotted series are kept. float32 close halves the
+    # memory traffic of the descriptive passes; features accumulate in float64.
+    close_dtype = np.float32 if args.precision == "f32" else np.float64
+    close = ohlcv["close"].to_numpy(dtype=close_dtype)
+    drawdown, rv_30, rv_120 = compute_features(close, 30, 120)
     log(f"Features computed in {time.perf_counter() - t:.2f}s", log_path=eda_log_path)
 
     figures: list[str] = []
+    rec = FigureRecycler(footer_lines, png_encode=args.png_encode)
 
     # 01 Close
     f1 = figdir / "01_close.png"
     t = step("Saving figure 01_close.png", log_path=eda_log_path)
     plot_series_datetime(
-        x_dt=ohlcv["dt_utc"],
-        y=ohlcv["close"].to_numpy(),
+        rec,
+        x_dt=ohlcv_dt,
+        y=close,
         title="Close (BTC/USDT) — Phase 1",
         out_path=f1,
-        footer_lines=footer_lines,
         xlabel="UTC",
         ylabel="Preço",
     )
@@ -500,11 +729,10 @@ def main() -> None:
     f2 = figdir / "02_realized_vol.png"
     t = step("Saving figure 02_realized_vol.png", log_path=eda_log_path)
 
-    x_dt = pd.to_datetime(ohlcv["dt_utc"], utc=True, errors="coerce")
-
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.plot(x_dt, ohlcv["rv_30"], label="RV(30)", linewidth=1.1)
-    ax.plot(x_dt, ohlcv["rv_120"], label="RV(120)", linewidth=1.1)
+    ax = rec.ax
+    n_px = FIG_SIZE[0] * FIG_DPI
+    ax.plot(*_decimate_minmax(ohlcv_dt, rv_30, n_px), label="RV(30)", linewidth=1.1)
+    ax.plot(*_decimate_minmax(ohlcv_dt, rv_120, n_px), label="RV(120)", linewidth=1.1)
     ax.set_title("Realized Volatility (log-return std) — proxy de regime")
     ax.set_xlabel("UTC")
     ax.set_ylabel("Volatilidade (std)")
@@ -512,8 +740,7 @@ def main() -> None:
 
     _format_datetime_axis(ax)
     _apply_common_style(ax)
-    fig.tight_layout()
-    save_figure(fig, f2, footer_lines=footer_lines, dpi=220)
+    rec.save_and_reset(f2)
 
     figures.append(f2.name)
     log(f"Saved 02_realized_vol.png in {time.perf_counter() - t:.2f}s", log_path=eda_log_path)
@@ -522,11 +749,11 @@ def main() -> None:
     f3 = figdir / "03_drawdown.png"
     t = step("Saving figure 03_drawdown.png", log_path=eda_log_path)
     plot_series_datetime(
-        x_dt=ohlcv["dt_utc"],
-        y=ohlcv["drawdown"].to_numpy(),
+        rec,
+        x_dt=ohlcv_dt,
+        y=drawdown,
         title="Log Drawdown — proxy de estresse",
         out_path=f3,
-        footer_lines=footer_lines,
         xlabel="UTC",
         ylabel="Drawdown (log)",
     )
@@ -538,24 +765,29 @@ def main() -> None:
         trades_path = run_dir / trades_candidates[0]
 
         t = step("Loading trades parquet", log_path=eda_log_path)
-        trades = pd.read_parquet(trades_path).sort_values("ts").reset_index(drop=True)
+        trades = load_sorted(trades_path, ["ts"])
         log(
             f"Trades loaded: rows={len(trades)} in {time.perf_counter() - t:.2f}s",
             log_path=eda_log_path,
         )
 
-        # Inter-arrival (s)
-        inter = (trades["ts"].diff() / 1000.0).dropna()
-        inter = inter[(inter > 0) & np.isfinite(inter)]
+        ts = trades["ts"].to_numpy()
+
+        # Inter-arrival (s): one contiguous array, no Series/Index alignment
+        d = np.diff(ts).astype(np.float64)
+        d /= 1000.0
+        inter = d[(d > 0) & np.isfinite(d)]
+        # Bin once; figures 04 and 05 share the same counts.
+        inter_counts, inter_edges = np.histogram(inter, bins=140)
 
         f4 = figdir / "04_trade_interarrival_hist.png"
         t = step("Saving figure 04_trade_interarrival_hist.png", log_path=eda_log_path)
-        plot_hist(
-            values=inter.to_numpy(),
+        plot_hist_precomputed(
+            rec,
+            inter_counts,
+            inter_edges,
             title="Trade inter-arrival (s) — hist",
             out_path=f4,
-            footer_lines=footer_lines,
-            bins=140,
             logy=False,
             xlabel="Inter-arrival (s)",
             ylabel="count",
@@ -568,12 +800,12 @@ def main() -> None:
 
         f5 = figdir / "05_trade_interarrival_hist_logy.png"
         t = step("Saving figure 05_trade_interarrival_hist_logy.png", log_path=eda_log_path)
-        plot_hist(
-            values=inter.to_numpy(),
+        plot_hist_precomputed(
+            rec,
+            inter_counts,
+            inter_edges,
             title="Trade inter-arrival (s) — hist (log-y) diagnóstico de cauda",
             out_path=f5,
-            footer_lines=footer_lines,
-            bins=140,
             logy=True,
             xlabel="Inter-arrival (s)",
             ylabel="count (log)",
@@ -584,20 +816,23 @@ def main() -> None:
             log_path=eda_log_path,
         )
 
-        # Intensity: trades/min (λ proxy)
+        # Intensity: trades/min (λ proxy), non-empty UTC minute bars only
         step_ms = 60_000
-        trades["bar_ts"] = (trades["ts"] // step_ms) * step_ms
-        intensity = trades.groupby("bar_ts").size().rename("trade_count").reset_index()
+        base = ts.min() // step_ms if ts.size else 0
+        counts = np.bincount((ts // step_ms - base).astype(np.int64))
+        bar_ts = (base + np.arange(counts.size)) * step_ms
+        mask = counts > 0
+        intensity = pd.DataFrame({"bar_ts": bar_ts[mask], "trade_count": counts[mask]})
         intensity["dt_utc"] = pd.to_datetime(intensity["bar_ts"], unit="ms", utc=True)
 
         f6 = figdir / "06_trade_intensity.png"
         t = step("Saving figure 06_trade_intensity.png", log_path=eda_log_path)
         plot_series_datetime(
+            rec,
             x_dt=intensity["dt_utc"],
             y=intensity["trade_count"].to_numpy(),
             title="Trade intensity (count/min) — proxy de λ(t)",
             out_path=f6,
-            footer_lines=footer_lines,
             xlabel="UTC",
             ylabel="trades/min",
         )
@@ -607,6 +842,8 @@ def main() -> None:
             log_path=eda_log_path,
         )
 
+    rec.close()
+
     # Update manifest + checksums
     t = step("Updating manifest and checksums", log_path=eda_log_path)
 
@@ -622,6 +859,8 @@ def main() -> None:
     manifest["parameters"]["eda"] = {
         "generated_utc": dt.datetime.now(dt.UTC).isoformat(),
         "figures_count": len(figures),
+        "precision": args.precision,
+        "png_encode": {"preset": args.png_encode, **PNG_ENCODE[args.png_encode]},
         "notes": [
             "EDA Phase 1: proxies de regime (RV, drawdown), intensidade (trades/min) "
             "e caudas (inter-arrival).",
@@ -629,20 +868,20 @@ def main() -> None:
             "requer telemetria (Phase 2).",
             "Figures are publish-grade: datetime axis + concise ticks + "
             "wrapped provenance footer (multi-line).",
+            f"Close held in memory as {np.dtype(close_dtype).name} (--precision "
+            f"{args.precision}); returns are log price ratios accumulated in float64. "
+            "Parquet artifacts are not modified.",
         ],
     }
 
     update_manifest(run_dir, manifest)
 
-    files_to_hash: list[Path] = [run_dir / "manifest.json"]
-    for f in manifest["artifacts"].get("data", []):
-        files_to_hash.append(run_dir / f)
-    for f in figures:
-        files_to_hash.append(figdir / f)
-    for log_name in manifest["artifacts"].get("logs", []) or []:
-        p = run_dir / log_name
-        if p.exists():
-            files_to_hash.append(p)
+    artifacts = manifest["artifacts"]
+    data = [run_dir / f for f in artifacts.get("data", []) or []]
+    figs = [figdir / f for f in figures]
+    logs = [run_dir / n for n in artifacts.get("logs", []) or [] if (run_dir / n).exists()]
+    # Sorted once so checksums.sha256 line order is deterministic across runs.
+    files_to_hash = tuple(sorted({run_dir / "manifest.json", *data, *figs, *logs}, key=str))
 
     checksum_path = run_dir / "checksums.sha256"
     write_checksums_sha256(files_to_hash, checksum_path)
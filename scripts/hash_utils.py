@@ -13,13 +13,32 @@ from __future__ import annotations
 
 import hashlib
 import json
+import math
+import mmap
+import os
 import platform
+import ssl
 import subprocess
+import sys
+import time
+import warnings
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import distributions
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+# Files at least this large are memory-mapped and hashed in a single update.
+MMAP_MIN_BYTES = 64 * 1024 * 1024
+# Read size for smaller files (unbuffered readinto).
+READ_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def sha256_file(path: Path, chunk_size: int = READ_CHUNK_BYTES) -> str:
     """Compute SHA256 hash for a file (streamed).
 
     Parameters
@@ -27,21 +46,56 @@ def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
     path:
         File path to hash.
     chunk_size:
-        Bytes per read; larger improves performance on big parquet files.
+        Read size for files below ``MMAP_MIN_BYTES``.
 
     Returns
     -------
     str
         SHA256 hex digest.
+
+    Notes
+    -----
+    Files of at least ``MMAP_MIN_BYTES`` are memory-mapped and hashed with one
+    call, so there is no Python-level read loop at all. Smaller files are read
+    unbuffered with ``readinto`` into one preallocated buffer (capped at the file
+    size), so the loop allocates nothing per chunk and issues large reads.
     """
     h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
+    with path.open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+            return h.hexdigest()
+        mv = memoryview(bytearray(max(1, min(chunk_size, size))))
+        while n := f.readinto(mv):
+            h.update(mv[:n])
     return h.hexdigest()
 
 
-def write_checksums_sha256(file_paths: Iterable[Path], out_path: Path) -> dict[str, str]:
+def _load_checksum_cache(cache_path: Path) -> dict:
+    """Load the checksum cache sidecar, returning an empty cache if absent or unreadable.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Sidecar path (``checksums.cache.json``).
+
+    Returns
+    -------
+    dict
+        Mapping ``rel -> [sha256, size, mtime_ns]``.
+    """
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def write_checksums_sha256(
+    file_paths: Iterable[Path], out_path: Path, max_workers: int = 8, use_cache: bool = True
+) -> dict[str, str]:
     """Write checksums.sha256 in standard format.
 
     Parameters
@@ -50,6 +104,11 @@ def write_checksums_sha256(file_paths: Iterable[Path], out_path: Path) -> dict[s
         List of file paths to hash.
     out_path : Path
         Output path for the checksum file.
+    max_workers : int, default=8
+        Upper bound on files hashed concurrently (hashlib releases the GIL).
+    use_cache : bool, default=True
+        Reuse digests from the ``<out_path stem>.cache.json`` sidecar for files whose
+        size and mtime_ns are unchanged, and refresh the sidecar afterwards.
 
     Returns
     -------
@@ -61,35 +120,82 @@ def write_checksums_sha256(file_paths: Iterable[Path], out_path: Path) -> dict[s
     Scientific rule:
     - relative_path MUST be relative to the directory containing checksums.sha256
       (i.e., the run directory), to keep artifacts portable across machines.
+    - lines follow the order of ``file_paths``, regardless of which hash finishes first.
+    - the cache only skips re-reading unchanged files; checksums.sha256 is identical
+      with or without it. Delete the sidecar to force a full rehash.
 
     """
     out_path = out_path.resolve()
     base_dir = out_path.parent.resolve()
     base_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = out_path.with_suffix(".cache.json")
+    cache = _load_checksum_cache(cache_path) if use_cache else {}
 
-    mapping: dict[str, str] = {}
-    lines: list[str] = []
-
-    for p in file_paths:
-        p = Path(p).resolve()
-        digest = sha256_file(p)
-
+    paths = [Path(p).resolve() for p in file_paths]
+    rels: list[str] = []
+    for p in paths:
         try:
-            rel = str(p.relative_to(base_dir))
+            rels.append(str(p.relative_to(base_dir)))
         except ValueError:
             # If artifact is outside the run directory, still record it,
             # but this should be avoided in this project.
-            rel = str(p)
+            rels.append(str(p))
 
+    stats = [p.stat() for p in paths]
+    digests: list[str | None] = []
+    for rel, st in zip(rels, stats, strict=True):
+        cached = cache.get(rel)
+        hit = isinstance(cached, list) and cached[1:] == [st.st_size, st.st_mtime_ns]
+        digests.append(cached[0] if hit else None)
+
+    misses = [i for i, d in enumerate(digests) if d is None]
+    if misses:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(misses)))) as pool:
+            fresh = list(pool.map(sha256_file, [paths[i] for i in misses]))
+        for i, digest in zip(misses, fresh, strict=True):
+            digests[i] = digest
+
+    mapping: dict[str, str] = {}
+    lines: list[str] = []
+    new_cache: dict[str, list] = {}
+    for rel, st, digest in zip(rels, stats, digests, strict=True):
         mapping[rel] = digest
         lines.append(f"{digest}  {rel}")
+        new_cache[rel] = [digest, st.st_size, st.st_mtime_ns]
 
     out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if use_cache:
+        cache_path.write_text(json.dumps(new_cache), encoding="utf-8")
     return mapping
 
 
+# Packages ``pip freeze`` omits by default (pip only keeps setuptools/wheel from 3.12 on).
+_FREEZE_EXCLUDE = (
+    frozenset({"pip"})
+    if sys.version_info >= (3, 12)
+    else frozenset({"pip", "setuptools", "wheel", "distribute"})
+)
+
+
 def get_pip_freeze() -> list[str]:
-    """Return pip freeze output lines for environment traceability."""
+    """Return ``name==version`` lines for installed distributions (pip freeze equivalent).
+
+    Distributions are enumerated in-process via ``importlib.metadata`` (no child
+    interpreter). As in ``pip freeze``, the first one found on ``sys.path`` wins for
+    duplicate names, packaging tools are skipped and lines are sorted
+    case-insensitively. Falls back to the ``pip freeze`` subprocess if metadata
+    enumeration fails.
+    """
+    try:
+        seen: dict[str, str] = {}
+        for d in distributions():
+            name = d.metadata["Name"] if d.metadata else None
+            if name and name.lower() not in _FREEZE_EXCLUDE:
+                seen.setdefault(name.lower().replace("_", "-"), f"{name}=={d.version}")
+        if seen:
+            return sorted(seen.values(), key=str.lower)
+    except Exception:
+        pass
     try:
         output = subprocess.check_output(["pip", "freeze"], stderr=subprocess.DEVNULL).decode(
             "utf-8"
@@ -99,6 +205,69 @@ def get_pip_freeze() -> list[str]:
         return []
 
 
+def sha256_backend(probe_mib: int = 8, min_mb_per_s: float = 1000.0) -> dict:
+    """Describe the SHA-256 backend and measure its single-core throughput.
+
+    Parameters
+    ----------
+    probe_mib : int, default=8
+        Size of the zero-filled buffer hashed by the probe, in MiB (enough to
+        tell SHA-NI from scalar rounds without slowing run initialization).
+    min_mb_per_s : float, default=1000.0
+        Throughput below which a warning is emitted (roughly the SHA-NI /
+        ARMv8 Crypto Extensions baseline).
+
+    Returns
+    -------
+    dict
+        Which implementation backs ``hashlib.sha256`` (``"openssl"`` via
+        ``_hashlib`` or ``"builtin"``), the OpenSSL version linked by ``ssl``,
+        whether sha256 is guaranteed, and measured MB/s.
+
+    Notes
+    -----
+    hashlib dispatches SHA-256 to OpenSSL; a build without SHA extensions falls
+    back to scalar rounds and makes checksumming several times slower.
+    ``_hashlib`` does not expose its own OpenSSL version, so the recorded
+    version is the one ``ssl`` linked against (normally the same libcrypto, but
+    not guaranteed). The probe is run when a run is initialized, never at
+    import time.
+    """
+    try:
+        import _hashlib
+    except ImportError:
+        _hashlib = None
+    openssl_sha256 = getattr(_hashlib, "openssl_sha256", None)
+    impl = (
+        "openssl" if openssl_sha256 is not None and hashlib.sha256 is openssl_sha256 else "builtin"
+    )
+
+    # Best of a few passes: the first one also pays for faulting in the buffer.
+    data = bytes(probe_mib * 1024 * 1024)
+    elapsed = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter()
+        hashlib.sha256(data).digest()
+        elapsed = min(elapsed, time.perf_counter() - t0)
+    mb_per_s = len(data) / 1e6 / max(elapsed, 1e-9)
+
+    if mb_per_s < min_mb_per_s:
+        warnings.warn(
+            f"SHA-256 throughput is {mb_per_s:.0f} MB/s (< {min_mb_per_s:.0f} MB/s); "
+            f"the {impl} SHA-256 backend may lack SHA CPU extensions "
+            f"(ssl links {ssl.OPENSSL_VERSION}).",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    return {
+        "sha256_impl": impl,
+        "ssl_openssl_version": ssl.OPENSSL_VERSION,
+        "sha256_guaranteed": "sha256" in hashlib.algorithms_guaranteed,
+        "sha256_mb_per_s": round(mb_per_s, 1),
+    }
+
+
 def environment_fingerprint() -> dict:
     """Capture environment metadata for manifest.json.
 
@@ -117,9 +286,32 @@ def environment_fingerprint() -> dict:
         "python_implementation": platform.python_implementation(),
         "architecture": platform.machine(),
         "pip_freeze": get_pip_freeze(),
+        "hashlib": sha256_backend(),
     }
 
 
+def _all_finite(obj: object) -> bool:
+    """Return False if any float nested in dicts/lists/tuples is NaN or infinite.
+
+    Parameters
+    ----------
+    obj : object
+        JSON-like object to scan.
+
+    Returns
+    -------
+    bool
+        True when every nested float is finite.
+    """
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, list | tuple):
+        return all(_all_finite(v) for v in obj)
+    return True
+
+
 def save_json(obj: dict, path: Path) -> None:
     """Write a JSON file with stable formatting.
 
@@ -129,8 +321,25 @@ def save_json(obj: dict, path: Path) -> None:
         Dictionary to serialize.
     path : Path
         Output file path.
+
+    Notes
+    -----
+    Uses ``orjson`` (C serializer, 2-space indent, UTF-8, insertion key order) when
+    installed, otherwise stdlib ``json`` with the same layout. Anything whose content
+    orjson would encode differently goes through stdlib ``json``: non-finite floats
+    (orjson writes ``null``, stdlib ``NaN``/``Infinity``) and types orjson rejects
+    (non-string keys, float subclasses such as NumPy scalars). The two paths then
+    parse to the same values; only float spelling may differ (``1e-7`` vs
+    ``1e-07``). The document is encoded once and written in a single call.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False, sort_keys=False)
-        f.write("\n")
+    if orjson is not None and _all_finite(obj):
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            path.write_bytes(data + b"\n")
+            return
+    text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=False)
+    path.write_text(text + "\n", encoding="utf-8")